@@ -205,11 +205,30 @@ def calcPiecewiseEBV2(muAnchor, DeltaEBV, mu):
 	return EBVinterp
 	
 
-def rasterizeMap(pixels, EBV, nside=512, nest=True, oversample=4):
-	# Determine pixel centers and bounds
+_rasterGeometryCache = {}
+
+def rasterGeometry(pixels, nside=512, nest=True, oversample=4):
+	'''
+	Maps each display pixel of the rasterized image onto an index into the
+	list of healpix pixels. This depends only on the pixel set and the
+	rasterization parameters, not on the map values, so it is cached.
+	
+	Outputs:
+	    idxEBV  (xSize*ySize)  Index into pixels for each display pixel.
+	    mask    (xSize*ySize)  True where the display pixel is not in pixels.
+	    shape   (xSize, ySize)
+	    bounds  (lMin, lMax, bMin, bMax)
+	'''
+	
 	pixels = np.array(pixels)
+	key = (nside, nest, oversample, pixels.dtype.str, pixels.tobytes())
+	if key in _rasterGeometryCache:
+		return _rasterGeometryCache[key]
+	
+	# Determine pixel centers and bounds
 	theta, phi = hp.pix2ang(nside, pixels, nest=nest)
-	lCenter, bCenter = 180./np.pi * phi, 90. - 180./np.pi * theta
+	lCenter = np.rad2deg(phi, out=phi)
+	bCenter = 90. - np.rad2deg(theta, out=theta)
 	
 	pixLength = np.sqrt( hp.nside2pixarea(nside, degrees=True) )
 	lMin, lMax = np.min(lCenter)-pixLength/2., np.max(lCenter)+pixLength/2.
@@ -219,35 +238,54 @@ def rasterizeMap(pixels, EBV, nside=512, nest=True, oversample=4):
 	xSize = int( oversample * (lMax - lMin) / pixLength )
 	ySize = int( oversample * (bMax - bMin) / pixLength )
 	
-	# Make grid of pixels to plot
-	l, b = np.mgrid[0:xSize, 0:ySize].astype(np.float32) + 0.5
-	l = lMax - (lMax - lMin) * l / float(xSize)
-	b = bMin + (bMax - bMin) * b / float(ySize)
-	theta, phi = np.pi/180. * (90. - b), np.pi/180. * l
-	del l, b
-	
-	pixIdx = hp.ang2pix(nside, theta, phi, nest=nest)
-	idxMap = np.empty(12*nside*nside, dtype='i8')
-	idxMap[:] = -1
-	idxMap[pixels] = np.arange(len(pixels))
-	idxEBV = idxMap[pixIdx]
-	mask = (idxEBV == -1)
-	del idxMap
+	# Make grid of pixels to plot, working directly in healpy's (theta, phi).
+	# phi only varies along x and theta along y, so build the two axes and let
+	# ang2pix broadcast them. float32 is ample to locate display pixels.
+	phi = np.arange(xSize, dtype=np.float32) + 0.5
+	phi *= np.float32(np.deg2rad(-(lMax - lMin) / float(xSize)))
+	phi += np.float32(np.deg2rad(lMax))
+	theta = np.arange(ySize, dtype=np.float32) + 0.5
+	theta *= np.float32(np.deg2rad(-(bMax - bMin) / float(ySize)))
+	theta += np.float32(np.deg2rad(90. - bMin))
+	
+	pixIdx = hp.ang2pix(nside, theta[np.newaxis,:], phi[:,np.newaxis], nest=nest)
+	pixIdx = pixIdx.ravel()
+	del theta, phi
+	
+	# Find the position of each display pixel in pixels by binary search,
+	# rather than filling a lookup table over all 12*nside^2 healpix pixels.
+	# Positions always fit in int32, halving the gathers done through idxEBV.
+	# A stable sort plus side='right' picks the last occurrence of a pixel
+	# listed more than once (e.g. by several input files).
+	order = np.argsort(pixels, kind='mergesort').astype('i4')
+	sortedPixels = pixels[order]
+	pos = np.searchsorted(sortedPixels, pixIdx, side='right') - 1
+	np.clip(pos, 0, len(sortedPixels)-1, out=pos)
+	mask = (sortedPixels[pos] != pixIdx)
+	idxEBV = order[pos]
+	del order, sortedPixels, pos, pixIdx
+	
+	geometry = (idxEBV, mask, (xSize, ySize), (lMin, lMax, bMin, bMax))
+	_rasterGeometryCache[key] = geometry
+	
+	return geometry
+
+def rasterizeMap(pixels, EBV, nside=512, nest=True, oversample=4):
+	idxEBV, mask, shape, bounds = rasterGeometry(pixels, nside, nest, oversample)
 	
 	# Grab pixels from map
 	img = None
 	if len(EBV.shape) == 1:
 		img = EBV[idxEBV]
 		img[mask] = np.nan
-		img.shape = (xSize, ySize)
+		img.shape = shape
 	elif len(EBV.shape) == 2:
 		img = EBV[:,idxEBV]
-		img[mask] = np.nan
-		img.shape = (img.shape[0], xSize, ySize)
+		img[:,mask] = np.nan
+		img.shape = (img.shape[0],) + shape
 	else:
 		raise Exception('EBV must be either 1- or 2-dimensional.')
 	
-	bounds = (lMin, lMax, bMin, bMax)
 	return img, bounds
 
 def calcEBV(muAnchor, DeltaEBV, mu, model='piecewise', maxSpread=None, calcSpread=False):
@@ -42,8 +42,8 @@ def mapper(qresult, nside, nest, bounds):
 	
 	if (obj != None) and (len(obj) > 0):
 		# Determine healpix index of each star
-		theta = np.pi/180. * (90. - obj['b'])
-		phi = np.pi/180. * obj['l']
+		theta = np.deg2rad(90. - obj['b'])
+		phi = np.deg2rad(obj['l'])
 		pix_indices = hp.ang2pix(nside, theta, phi, nest=nest)
 		
 		# Group together stars having same index
@@ -51,8 +51,8 @@ def mapper(qresult, nside, nest, bounds):
 			# Filter out pixels by bounds
 			if bounds != None:
 				theta_0, phi_0 = hp.pix2ang(nside, pix_index, nest=nest)
-				l_0 = 180./np.pi * phi_0
-				b_0 = 90. - 180./np.pi * theta_0
+				l_0 = np.rad2deg(phi_0)
+				b_0 = 90. - np.rad2deg(theta_0)
 				if (l_0 < bounds[0]) or (l_0 > bounds[1]) or (b_0 < bounds[2]) or (b_0 > bounds[3]):
 					continue
 			
@@ -102,8 +102,8 @@ def to_file(f, pix_index, nside, nest, EBV, data):
 	
 	N_stars = data.shape[0]
 	t,p = hp.pixelfunc.pix2ang(nside, pix_index, nest=nest)
-	t *= 180. / np.pi
-	p *= 180. / np.pi
+	t = np.rad2deg(t)
+	p = np.rad2deg(p)
 	gal_lb = np.array([p, 90. - t], dtype='f8')
 	
 	att_f8 = np.array([EBV], dtype='f8')
@@ -164,7 +164,7 @@ def main():
 	# Determine the query bounds
 	query_bounds = []
 	if values.bounds != None:
-		pix_scale = hp.pixelfunc.nside2resol(values.nside) * 180. / np.pi
+		pix_scale = np.rad2deg(hp.pixelfunc.nside2resol(values.nside))
 		query_bounds.append(max([0., values.bounds[0] - 3.*pix_scale]))
 		query_bounds.append(min([360., values.bounds[1] + 3.*pix_scale]))
 		query_bounds.append(max([-90., values.bounds[2] - 3.*pix_scale]))
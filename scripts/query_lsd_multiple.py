@@ -42,8 +42,8 @@ def mapper(qresult, target_tp, target_radius):
 	
 	if (obj != None) and (len(obj) > 0):
 		# Find nearest target center to each star
-		theta = np.pi/180. * (90. - obj['b'])
-		phi = np.pi/180. * obj['l']
+		theta = np.deg2rad(90. - obj['b'])
+		phi = np.deg2rad(obj['l'])
 		tp_star = np.array([theta, phi]).T
 		d = great_circle_dist(tp_star, target_tp) / target_radius
 		min_idx = np.argmin(d, axis=1)
@@ -209,8 +209,8 @@ def main():
 	target_lb[:,0] = l
 	target_lb[:,1] = b
 	target_tp = np.empty((len(l), 2), dtype='f8')
-	target_tp[:,0] = np.pi/180. * (90. - b)
-	target_tp[:,1] = np.pi/180. * l
+	target_tp[:,0] = np.deg2rad(90. - b)
+	target_tp[:,1] = np.deg2rad(l)
 	
 	# Set up the query
 	db = lsd.DB(os.environ['LSD_DB'])